@@ -67,6 +67,8 @@ class Position:
         4
     """
 
+    __slots__ = ('_x', '_y', '_hash')
+
     def __init__(self, x: int, y: int):
         """
         The position class is constructed from the x and y coordinate which the
@@ -78,6 +80,7 @@ class Position:
         """
         self._x = x
         self._y = y
+        self._hash = hash((x, y))
 
     def get_x(self) -> int:
         """Returns the x coordinate of the position."""
@@ -160,11 +163,12 @@ class Position:
         A hash should be based on the unique data of a class, in the case
         of the position class, the unique data is the x and y values.
         Therefore, we can calculate an appropriate hash by hashing a tuple of
-        the x and y values.
+        the x and y values. Positions are not modified after construction,
+        so the hash is calculated once in __init__.
 
         Reference: https://stackoverflow.com/questions/17585730/what-does-hash-do-in-python
         """
-        return hash((self.get_x(), self.get_y()))
+        return self._hash
 
     def __repr__(self) -> str:
         """
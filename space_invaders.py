@@ -3,13 +3,16 @@ import tkinter as tk
 import random
 from tkinter import messagebox
 from tkinter import filedialog
-from typing import Callable
+from types import MappingProxyType
+from typing import Callable, Mapping
 
 
 class Entity(object):
     """Entity is an abstract class that is used to represent any element that
     can appear on the game’s grid. """
 
+    __slots__ = ()
+
     def display(self) -> str:
         """(str) Return the character used to represent this entity in a
         text-based grid. """
@@ -23,6 +26,8 @@ class Entity(object):
 class Player(Entity):
     """A subclass of Entity representing a Player within the game."""
 
+    __slots__ = ()
+
     def display(self) -> str:
         """(str) Return the character representing a player"""
         return PLAYER
@@ -31,6 +36,8 @@ class Player(Entity):
 class Destroyable(Entity):
     """A subclass of Entity representing a Destroyable within the game. """
 
+    __slots__ = ()
+
     def display(self) -> str:
         """(str) Return the character representing a destroyable"""
         return DESTROYABLE
@@ -39,6 +46,8 @@ class Destroyable(Entity):
 class Collectable(Entity):
     """A subclass of Entity representing a Collectable within the game."""
 
+    __slots__ = ()
+
     def display(self) -> str:
         """(str) Return the character representing a collectable"""
         return COLLECTABLE
@@ -47,6 +56,8 @@ class Collectable(Entity):
 class Blocker(Entity):
     """A subclass of Entity representing a Blocker within the game."""
 
+    __slots__ = ()
+
     def display(self) -> str:
         """(str) Return the character representing a blocker"""
         return BLOCKER
@@ -55,11 +66,26 @@ class Blocker(Entity):
 class Bomb(Entity):
     """A subclass of Entity representing a Bomb within the game."""
 
+    __slots__ = ()
+
     def display(self) -> str:
         """(str) Return the character representing a bomb"""
         return BOMB
 
 
+# One shared instance of each entity type
+_ENTITIES = {COLLECTABLE: Collectable(),
+             DESTROYABLE: Destroyable(),
+             BLOCKER: Blocker(),
+             BOMB: Bomb()}
+
+# Offsets of the cells cleared by a bomb hit
+_SPLASH_OFFSETS = tuple(Position(x, y) for x, y in SPLASH)
+
+# Deletes the brackets and commas of saved positions and spaces them out
+_SAVED_POSITION_TABLE = str.maketrans('|', ' ', '(),')
+
+
 class Grid(object):
     """The Grid class is used to represent the 2D grid of entities."""
 
@@ -73,6 +99,7 @@ class Grid(object):
         """
         self._size = size
         self._entities = {}
+        self._serialised = None
 
     def get_size(self) -> int:
         """(int) Return the size of the grid"""
@@ -87,11 +114,34 @@ class Grid(object):
         """
         if self.in_bounds(position):
             self._entities[position] = entity
+            self._serialised = None
 
     def get_entities(self) -> Dict[Position, Entity]:
-        """(dict) Return the dictionary containing grid entities"""
+        """(dict) Return a copy of the dictionary containing grid entities.
+
+        This copies every entry, so callers that only read the entities
+        should use view_entities instead. """
         return self._entities.copy()
 
+    def view_entities(self) -> Mapping[Position, Entity]:
+        """(Mapping) Return a live, read-only mapping of the grid entities
+        without copying them.
+
+        The grid must not be changed while the mapping is being iterated. """
+        return MappingProxyType(self._entities)
+
+    def set_entities(self, entities: Dict[Position, Entity]) -> None:
+        """Replace every entity in the grid with the given mapping.
+
+        The mapping is taken as is, so the caller is responsible for only
+        providing in bounds positions.
+
+        Parameters:
+            entities (dict): the new mapping of positions to entities
+        """
+        self._entities = entities
+        self._serialised = None
+
     def get_entity(self, position: Position) -> Optional[Entity]:
         """(Optional) Return a entity from the grid at a specific position
 
@@ -106,14 +156,25 @@ class Grid(object):
         Parameters:
             position (Position): the position of the entity
         """
-        self._entities.pop(position, None)
+        if self._entities.pop(position, None) is not None:
+            self._serialised = None
+
+    def clear(self) -> None:
+        """Remove every entity from the grid"""
+        self._entities.clear()
+        self._serialised = None
 
-    def serialise(self) -> Dict[Tuple[int, int], str]:
-        """(dict) Convert dictionary of Position and Entities into a
+    def serialise(self) -> Mapping[Tuple[int, int], str]:
+        """(Mapping) Convert dictionary of Position and Entities into a
         simplified, serialised dictionary mapping tuples to characters,
-        and return this serialised mapping. """
-        return {(position.get_x(), position.get_y()): entity.display()
+        and return a read-only view of this serialised mapping.
+
+        The mapping is cached until the grid changes. """
+        if self._serialised is None:
+            self._serialised = {
+                (position.get_x(), position.get_y()): entity.display()
                 for position, entity in self._entities.items()}
+        return MappingProxyType(self._serialised)
 
     def in_bounds(self, position: Position) -> bool:
         """(bool) Return a boolean based on whether the position is valid in
@@ -148,6 +209,9 @@ class Game(object):
         self._grid = Grid(size)
         self._flag = None
         self._PLAYER_POSITION = Position(size // 2, 0)
+        self._SPAWN_POSITIONS = tuple(
+            Position(x, size - 1) for x in range(size)
+        )
         self._acquired_collectable = 0
         self._removed_destroyable = 0
         self._shots = 0
@@ -224,101 +288,87 @@ class Game(object):
         Parameters:
             direction (str): left or right in valid string form
         """
-        if direction == LEFT:
-            rotation_x, rotation_y = ROTATIONS[0]
-            out_bound_x = self.get_grid().get_size() - 1
-        else:
-            rotation_x, rotation_y = ROTATIONS[1]
-            out_bound_x = 0
-        rotate = Position(rotation_x, rotation_y)
-        rotated_entities = {}
+        rotation_x, _ = ROTATIONS[0] if direction == LEFT else ROTATIONS[1]
+        size = self._grid.get_size()
 
-        for position, entity in self._grid.get_entities().items():
-            self._grid.remove_entity(position)
-            new_position = position.add(rotate)
-            if not self._grid.in_bounds(new_position):
-                new_position = Position(out_bound_x, new_position.get_y())
-            rotated_entities[new_position] = entity
+        # entities moved off an edge wrap around to the other side
+        self._grid.set_entities({
+            Position((position.get_x() + rotation_x) % size,
+                     position.get_y()): entity
+            for position, entity in self._grid.view_entities().items()
+        })
 
-        for pos, en in rotated_entities.items():
-            self._grid.add_entity(pos, en)
-
-    def load_entities(self, entities: Dict[tuple, str]) -> None:
-        """Load the entities data
+    def load_entities(self, entities: Dict[Tuple[int, int], str]) -> None:
+        """Load the entities data, in the same form as Grid.serialise returns
 
         Parameters:
-            entities (dict): All the entities that need loading.
+            entities (dict): All the entities that need loading, mapping
+                             (x, y) integer tuples to entity characters.
         """
-        # clear all entities
-        for pos, _ in self.get_grid().get_entities().items():
-            self.get_grid().remove_entity(pos)
+        grid = self.get_grid()
+        grid.clear()
+        size = grid.get_size()
+        create_entity = self._create_entity
 
         # add entities
         for position, entity in entities.items():
             x, y = position
-            pos = Position(int(x), int(y))
-            if not self.get_grid().in_bounds(pos):
+            if x < 0 or x >= size or y < 1 or y >= size:
                 continue
-            entity = self._create_entity(entity)
-            self.get_grid().add_entity(pos, entity)
+            grid.add_entity(Position(x, y), create_entity(entity))
 
     def _create_entity(self, display: str) -> Entity:
         """Uses a display character to create an Entity.
 
+        The shared instance of the entity type is returned rather than a new
+        one.
+
         Parameters:
             display (str): The entity type in string form
         """
-        entity = {
-            COLLECTABLE: Collectable(),
-            DESTROYABLE: Destroyable(),
-            BLOCKER: Blocker(),
-            BOMB: Bomb()}
-        if display not in entity:
+        entity = _ENTITIES.get(display)
+        if entity is None:
             raise NotImplementedError
-        else:
-            return entity[display]
+        return entity
 
     def generate_entities(self) -> None:
         """
         Method given to the students to generate a random amount of entities to
         add into the game after each step
         """
+        grid = self.get_grid()
+
         # Generate amount
-        entity_count = random.randint(0, self.get_grid().get_size() - 3)
+        entity_count = random.randint(0, grid.get_size() - 3)
         entities = random.choices(ENTITY_TYPES, k=entity_count)
 
         # Blocker in a 1 in 4 chance
-        blocker = random.randint(1, 4) % 4 == 0
-
-        total_count = entity_count
-        if blocker:
-            total_count += 1
+        if not random.getrandbits(2):
             entities.append(BLOCKER)
 
-        entity_index = random.sample(range(self.get_grid().get_size()),
-                                     total_count)
+        positions = random.sample(self._SPAWN_POSITIONS, len(entities))
 
         # Add entities into grid
-        for pos, entity in zip(entity_index, entities):
-            position = Position(pos, self.get_grid().get_size() - 1)
-            new_entity = self._create_entity(entity)
-            self.get_grid().add_entity(position, new_entity)
+        create_entity = self._create_entity
+        for position, entity in zip(positions, entities):
+            grid.add_entity(position, create_entity(entity))
 
     def step(self) -> None:
         """Moves all entities on the board by an offset of (0, -1)"""
-        move = Position(MOVE[0], MOVE[1])
-        for position, entity in self._grid.get_entities().items():
-            self._grid.remove_entity(position)
-            new_position = position.add(move)
-            if not self._grid.in_bounds(new_position):
-                if entity.display() == DESTROYABLE:
-                    self.die()
-                    if not self.alive():
-                        self._flag = False
-                continue
-
-            self._grid.add_entity(new_position, entity)
-
+        move_x, move_y = MOVE
+        size = self._grid.get_size()
+        moved_entities = {}
+        for position, entity in self._grid.view_entities().items():
+            x = position.get_x() + move_x
+            y = position.get_y() + move_y
+            if 0 <= x < size and 1 <= y < size:
+                moved_entities[Position(x, y)] = entity
+            elif entity.display() == DESTROYABLE:
+                self.die()
+                if not self.alive():
+                    self._flag = False
+
+        self._grid.set_entities(moved_entities)
         self.generate_entities()
 
     def fire(self, shot_type: str) -> None:
@@ -332,36 +382,34 @@ class Game(object):
         if shot_type not in SHOT_TYPES:
             return None
 
-        fire_dir = Position(FIRE[0], FIRE[1])
-        entity_pos = self.get_player_position()
-        for _ in range(self.get_grid().get_size() - 1):
-            entity_pos = entity_pos.add(fire_dir)
-            entity = self.get_grid().get_entity(entity_pos)
+        grid = self.get_grid()
 
-            if entity is None:
-                continue
-            if entity.display() == BLOCKER:
-                return None
-            # collect type shot
-            if shot_type == COLLECT:
-                if entity.display() == COLLECTABLE:
-                    self._acquired_collectable += 1
-                    self.get_grid().remove_entity(entity_pos)
-                    if self._acquired_collectable == COLLECTION_TARGET:
-                        self._flag = True
-                return None
-            # destroy type shot
-            else:
-                if entity.display() == BOMB:
-                    for x, y in SPLASH:
-                        neighbour_pos = entity_pos.add(Position(x, y))
-                        neighbour = self.get_grid().get_entity(neighbour_pos)
-                        if neighbour is not None:
-                            self.get_grid().remove_entity(neighbour_pos)
-                elif entity.display() == DESTROYABLE:
-                    self._removed_destroyable += 1
-                self.get_grid().remove_entity(entity_pos)
-                return None
+        # every shot stops at the nearest entity in the player's column
+        player_x = self.get_player_position().get_x()
+        column = [position for position, _ in grid.view_entities().items()
+                  if position.get_x() == player_x]
+        if not column:
+            return None
+        entity_pos = min(column, key=Position.get_y)
+        entity_type = grid.get_entity(entity_pos).display()
+
+        if entity_type == BLOCKER:
+            return None
+        # collect type shot
+        if shot_type == COLLECT:
+            if entity_type == COLLECTABLE:
+                self._acquired_collectable += 1
+                grid.remove_entity(entity_pos)
+                if self._acquired_collectable == COLLECTION_TARGET:
+                    self._flag = True
+        # destroy type shot
+        else:
+            if entity_type == BOMB:
+                for offset in _SPLASH_OFFSETS:
+                    grid.remove_entity(entity_pos.add(offset))
+            elif entity_type == DESTROYABLE:
+                self._removed_destroyable += 1
+            grid.remove_entity(entity_pos)
 
     def has_won(self) -> bool:
         """(bool) Return True if the player has won the game"""
@@ -371,6 +419,11 @@ class Game(object):
         """(bool) Returns True if the game is lost"""
         return False if self._flag is None else not self._flag
 
+    def reset_result(self) -> None:
+        """Forgets whether the game was won or lost, so it can be played
+        again"""
+        self._flag = None
+
 
 class AbstractField(tk.Canvas):
     """ An abstract view class which inherits from tk.Canvas and provides
@@ -482,21 +535,72 @@ class GameField(AbstractField):
         """
         super().__init__(
             master, rows=size, cols=size, width=width, height=height, **kwargs)
+        # position -> (item ids, entity type) drawn last frame
+        self._items = {}
 
-    def draw_grid(self, entities: Dict[Position, Entity]) -> None:
-        """Draws the entities in the game grid at their given position using a
-        coloured rectangle with superimposed text identifying the entity
+    def draw_grid(self, entities: Mapping[Position, Entity]) -> None:
+        """Draws the entities in the game grid at their given position
+
+        Only the cells that changed since the last call are touched: items of
+        removed entities are deleted, new entities get new items and cells
+        whose entity type changed are recoloured.
 
         Parameters:
-            entities (dict): A dict of current entities, including the player
+            entities (Mapping): The current entities, excluding the player
         """
+        for pos in self._items.keys() - entities.keys():
+            ids, _ = self._items.pop(pos)
+            self.delete(*ids)
+
         for pos, entity in entities.items():
             entity_type = entity.display()
-            color = COLOURS[entity_type]
-            x_min, y_min, x_max, y_max = self.get_bbox(pos)
+            item = self._items.get(pos)
+            if item is None:
+                self._items[pos] = (self._draw_cell(pos, entity_type),
+                                    entity_type)
+            elif item[1] != entity_type:
+                self._recolour_cell(item[0], entity_type)
+                self._items[pos] = (item[0], entity_type)
+
+    def draw_player(self, position: Position) -> None:
+        """Draws the player. The player never moves, so this is only called
+        once and the player is left out of draw_grid.
 
-            self.create_rectangle(x_min, y_min, x_max, y_max, fill=color)
-            self.annotate_position(pos, entity_type)
+        Parameters:
+            position (Position): the position of the player
+        """
+        self._draw_cell(position, PLAYER)
+
+    def _draw_cell(
+            self, position: Position, entity_type: str
+    ) -> Tuple[int, ...]:
+        """Draws a coloured rectangle labelled with the entity type
+
+        Parameters:
+            position (Position): the position of the cell
+            entity_type (str): the display character of the entity
+
+        Returns:
+            (tuple): the ids of the rectangle and the text drawn
+        """
+        x_min, y_min, x_max, y_max = self.get_bbox(position)
+
+        rect_id = self.create_rectangle(
+            x_min, y_min, x_max, y_max, fill=COLOURS[entity_type])
+        text_id = self.create_text(
+            (x_min + x_max) // 2, (y_min + y_max) // 2, text=entity_type)
+        return rect_id, text_id
+
+    def _recolour_cell(self, ids: Tuple[int, ...], entity_type: str) -> None:
+        """Changes the cell drawn by _draw_cell to show another entity type
+
+        Parameters:
+            ids (tuple): the ids returned by _draw_cell
+            entity_type (str): the display character of the new entity
+        """
+        rect_id, text_id = ids
+        self.itemconfig(rect_id, fill=COLOURS[entity_type])
+        self.itemconfig(text_id, text=entity_type)
 
     def draw_player_area(self) -> None:
         """Draws the grey area the player is placed on"""
@@ -529,9 +633,13 @@ class ScoreBar(AbstractField):
             height=MAP_HEIGHT,
             **kwargs
         )
+        self._collected_id = None
+        self._destroyed_id = None
+        self._lives_id = None
 
     def draw_static_stuff(self, task: int) -> None:
-        """Draws score area and the text
+        """Draws score area and the text, along with the score numbers which
+        are then updated in place
 
         Parameters:
             task (int): the current TASK
@@ -554,6 +662,35 @@ class ScoreBar(AbstractField):
         if task == 3:
             self.annotate_position(lives, 'Lives')
 
+        self._collected_id = self.annotate_position(Position(1, 1), '0')
+        self._destroyed_id = self.annotate_position(Position(1, 2), '0')
+        if task == 3:
+            self._lives_id = self.annotate_position(Position(1, 3), '0')
+
+    def set_collected(self, num: int) -> None:
+        """Updates the number of collected entities shown
+
+        Parameters:
+            num (int): the number of collectables collected
+        """
+        self.itemconfig(self._collected_id, text=str(num))
+
+    def set_destroyed(self, num: int) -> None:
+        """Updates the number of destroyed entities shown
+
+        Parameters:
+            num (int): the number of destroyables destroyed
+        """
+        self.itemconfig(self._destroyed_id, text=str(num))
+
+    def set_lives(self, num: int) -> None:
+        """Updates the number of lives shown. Only used in TASK 3.
+
+        Parameters:
+            num (int): the number of lives the player has
+        """
+        self.itemconfig(self._lives_id, text=str(num))
+
     def annotate_position(self, position: Position, text: str) -> int:
         """Annotates the center of the cell at the given (row, column) position
         with the provided text.
@@ -581,8 +718,8 @@ class HackerController(object):
         """
         self._master = master
         self._size = size
-        self._scores = []
         self._wait = None
+        self._dirty = False
         self._time = 0
         self._game = self.initialize_game()
         self._title_frame = None
@@ -593,6 +730,7 @@ class HackerController(object):
 
         self.initialize_frames()
         self.initialize_fields()
+        self._game_field.draw_player(self._game.get_player_position())
 
         self._master.bind('<Key>', self.handle_keypress)
         self.draw(self._game)
@@ -621,6 +759,8 @@ class HackerController(object):
             self._game_frame, self._size, MAP_WIDTH, MAP_HEIGHT
         )
         self._game_field.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
+        self._game_field.draw_player_area()
+        self._game_field.draw_field_area()
 
         self._score_bar = ScoreBar(self._game_frame, self._size)
         self._score_bar.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
@@ -640,33 +780,33 @@ class HackerController(object):
             self.check_won_lost()
 
     def draw(self, game: Game) -> None:
-        """Clears and redraws the view based on the current game state
+        """Redraws the view based on the current game state
 
         Parameters:
             game (Game): the current game
         """
         # draw game field
-        self._game_field.delete(tk.ALL)
-        self._game_field.draw_player_area()
-        self._game_field.draw_field_area()
-        entities = game.get_grid().get_entities()
-        entities[game.get_player_position()] = Player()
-        self._game_field.draw_grid(entities)
+        self._game_field.draw_grid(game.get_grid().view_entities())
 
         # draw score num
-        for score in self._scores:
-            self._score_bar.delete(score)
+        self._score_bar.set_collected(game.get_num_collected())
+        self._score_bar.set_destroyed(game.get_num_destroyed())
 
-        self._scores.append(
-            self._score_bar.annotate_position(
-                Position(1, 1), str(game.get_num_collected())
-            )
-        )
-        self._scores.append(
-            self._score_bar.annotate_position(
-                Position(1, 2), str(game.get_num_destroyed())
-            )
-        )
+    def request_draw(self) -> None:
+        """Schedules a redraw of the view for when Tk is next idle.
+
+        Any further requests before then are merged into the same redraw,
+        so a shot and a step handled together only draw once.
+        """
+        if not self._dirty:
+            self._dirty = True
+            self._master.after_idle(self._draw_if_dirty)
+
+    def _draw_if_dirty(self) -> None:
+        """Redraws the view if a redraw is still pending"""
+        if self._dirty:
+            self._dirty = False
+            self.draw(self._game)
 
     def handle_rotate(self, direction: str) -> None:
         """Handles rotation of the entities and redrawing the game.
@@ -675,7 +815,7 @@ class HackerController(object):
             direction (str): the direction to rotate
         """
         self._game.rotate_grid(direction)
-        self.draw(self._game)
+        self.request_draw()
 
     def handle_fire(self, shot_type: str) -> None:
         """Handles the firing of the specified shot type and redrawing of
@@ -685,7 +825,7 @@ class HackerController(object):
             shot_type (str): the shot type the player fired
          """
         self._game.fire(shot_type)
-        self.draw(self._game)
+        self.request_draw()
 
     def wait(self) -> None:
         """Waits for some time."""
@@ -695,23 +835,49 @@ class HackerController(object):
         """Called every 2 seconds. Triggers the step method for the game and
         updates the view accordingly """
         self._game.step()
-        self.draw(self._game)
-        self.check_won_lost()
-        self.wait()
+        self.request_draw()
+        if not self.check_won_lost():
+            self.wait()
 
-    def check_won_lost(self) -> None:
-        """Check if the game has won or lost and end the game"""
+    def check_won_lost(self) -> bool:
+        """Check if the game has won or lost and end the game
+
+        Returns:
+            (bool): True if the game is over
+        """
         msg = ''
         if self._game.has_won():
             msg = 'won!'
         elif self._game.has_lost():
             msg = 'lost!'
-        if msg:
-            self._master.after_cancel(self._wait)
-            if messagebox.showwarning(
-                    title='Game Over', message=f'You {msg}'
-            ) == 'ok':
-                self._master.destroy()
+        if not msg:
+            return False
+
+        self._master.after_cancel(self._wait)
+        self._wait = None
+        self._master.unbind('<Key>')
+        self.show_game_over(msg)
+        return True
+
+    def show_game_over(self, msg: str) -> None:
+        """Shows the result in a window that ends the game once closed.
+
+        Unlike a messagebox this does not block the Tk event loop, so the
+        game field can still be redrawn while the window is open.
+
+        Parameters:
+            msg (str): the result of the game
+        """
+        window = tk.Toplevel(self._master)
+        window.title('Game Over')
+        window.transient(self._master)
+        window.protocol('WM_DELETE_WINDOW', self._master.destroy)
+        tk.Label(window, text=f'You {msg}', padx=20, pady=10).pack()
+        tk.Button(
+            window, text='OK', width=8, command=self._master.destroy
+        ).pack(pady=(0, 10))
+        # grab the window once it is shown
+        window.bind('<Map>', lambda event: window.grab_set())
 
 
 class AdvancedHackerController(HackerController):
@@ -746,6 +912,8 @@ class AdvancedHackerController(HackerController):
             self._game_frame, self._size, MAP_WIDTH, MAP_HEIGHT
         )
         self._game_field.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
+        self._game_field.draw_player_area()
+        self._game_field.draw_field_area()
 
         self._score_bar = ScoreBar(self._game_frame, self._size)
         self._score_bar.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
@@ -778,8 +946,9 @@ class AdvancedHackerController(HackerController):
         # step every 2s
         if not self._time % 2:
             self._game.step()
-            self.draw(self._game)
-            self.check_won_lost()
+            self.request_draw()
+            if self.check_won_lost():
+                return None
         self.wait()
 
     def pause_resume(self) -> None:
@@ -792,7 +961,8 @@ class AdvancedHackerController(HackerController):
     def pause(self) -> None:
         """Pauses the game"""
         self._status_frame.get_btn().config(text='Resume')
-        self._master.after_cancel(self._wait)
+        if self._wait is not None:
+            self._master.after_cancel(self._wait)
         self._master.unbind('<Key>')
         self._playing = False
 
@@ -811,17 +981,17 @@ class AdvancedHackerController(HackerController):
         self._game.set_num_destroyed(0)
         self._game.set_num_collected(0)
         self._game.set_total_shots(0)
+        self._game.reset_result()
         self._status_frame.update_shot(0)
         self._game.set_life(1)
         self._game.load_entities({})
-        self.draw(self._game)
+        self.request_draw()
         self.resume()
 
     def save_game(self) -> None:
         """Saves the game"""
         self.pause()
-        pos = '|'.join(map(str, self._game.get_grid().serialise().keys()))
-        entity = '|'.join(self._game.get_grid().serialise().values())
+        serialised = self._game.get_grid().serialise()
         try:
             file = filedialog.asksaveasfile(
                 initialdir='./',
@@ -835,9 +1005,17 @@ class AdvancedHackerController(HackerController):
                 f'Shots: {self._game.get_total_shots()}\n',
                 f'Collected: {self._game.get_num_collected()}\n',
                 f'Destroyed: {self._game.get_num_destroyed()}\n',
-                f'Positions: {pos}\n',
-                f'Entities: {entity}'
             ])
+            file.write('Positions: ')
+            file.writelines(
+                f'|{pos}' if i else str(pos)
+                for i, pos in enumerate(serialised)
+            )
+            file.write('\nEntities: ')
+            file.writelines(
+                f'|{entity}' if i else entity
+                for i, entity in enumerate(serialised.values())
+            )
             file.close()
 
         # cancel saving
@@ -857,18 +1035,33 @@ class AdvancedHackerController(HackerController):
             (10, 'Entities: ')
         ]
         restored_data = []
-        try:
-            with filedialog.askopenfile(mode='r') as game_data:
-                for line_num, data in enumerate(game_data):
-                    to, value = data_format[line_num]
-                    if data[:to] == value:
-                        restored_data.append(data[to:])
-                    else:
-                        raise ValueError
+        game_data = filedialog.askopenfile(mode='r')
         # cancel loading
-        except AttributeError:
+        if game_data is None:
             self.resume()
             return None
+        try:
+            with game_data:
+                for (to, value), data in zip(data_format, game_data):
+                    if data[:to] != value:
+                        raise ValueError
+                    restored_data.append(data[to:])
+                if (len(restored_data) < len(data_format)
+                        or next(game_data, '')):
+                    raise ValueError
+
+            time, life, shots, collected, destroyed = map(
+                int, restored_data[:5])
+            # '(x, y)|(x, y)' becomes 'x y x y'
+            tokens = restored_data[5].translate(_SAVED_POSITION_TABLE).split()
+            names = restored_data[6].strip()
+            names = names.split('|') if names else []
+            # every entity needs exactly one x and one y coordinate
+            if len(tokens) != 2 * len(names):
+                raise ValueError
+            # pair up consecutive coordinates
+            coords = map(int, tokens)
+            entities = dict(zip(zip(coords, coords), names))
         # file includes wrong game data
         except ValueError:
             messagebox.showerror(
@@ -877,27 +1070,24 @@ class AdvancedHackerController(HackerController):
             self.resume()
             return None
 
-        self._time = int(restored_data[0])
-        self._status_frame.update_time(int(restored_data[0]))
+        game = self._game
+        status = self._status_frame
 
-        self._game.set_life(int(restored_data[1]))
+        self._time = time
+        status.update_time(self._time)
 
-        self._game.set_total_shots(int(restored_data[2]))
-        self._status_frame.update_shot(int(restored_data[2]))
+        game.reset_result()
+        game.set_life(life)
 
-        self._game.set_num_collected(int(restored_data[3]))
-        self._game.set_num_destroyed(int(restored_data[4]))
+        game.set_total_shots(shots)
+        status.update_shot(game.get_total_shots())
 
-        positions = restored_data[5].split("|")
-        positions = list(
-            map(lambda x: tuple(x.strip()[1:-1].split(', ')), positions)
-        )
-        entities = restored_data[6].split("|")
-        self._game.load_entities(
-            dict(zip(positions, entities))
-        )
+        game.set_num_collected(collected)
+        game.set_num_destroyed(destroyed)
 
-        self.draw(self._game)
+        game.load_entities(entities)
+
+        self.request_draw()
         self.resume()
 
     def quit(self):
@@ -923,6 +1113,8 @@ class MoreAdvancedHackerController(AdvancedHackerController):
             self._game_frame, self._size, MAP_WIDTH, MAP_HEIGHT
         )
         self._game_field.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
+        self._game_field.draw_player_area()
+        self._game_field.draw_field_area()
 
         self._score_bar = ScoreBar(self._game_frame, self._size)
         self._score_bar.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
@@ -934,17 +1126,13 @@ class MoreAdvancedHackerController(AdvancedHackerController):
         self._status_frame.set_button(self.pause_resume)
 
     def draw(self, game: Game) -> None:
-        """Clears and redraws the view based on the current game state
+        """Redraws the view based on the current game state
 
         Parameters:
             game (Game): the current game
         """
         super().draw(game)
-        self._scores.append(
-            self._score_bar.annotate_position(
-                Position(1, 3), str(game.get_life())
-            )
-        )
+        self._score_bar.set_lives(game.get_life())
 
     def new_game(self) -> None:
         """Starts the game from scratch."""
@@ -954,10 +1142,11 @@ class MoreAdvancedHackerController(AdvancedHackerController):
         self._game.set_num_destroyed(0)
         self._game.set_num_collected(0)
         self._game.set_total_shots(0)
+        self._game.reset_result()
         self._status_frame.update_shot(0)
         self._game.set_life(2)
         self._game.load_entities({})
-        self.draw(self._game)
+        self.request_draw()
         self.resume()
 
 
@@ -979,34 +1168,51 @@ class MoreAdvancedGame(Game):
         Method given to the students to generate a random amount of entities to
         add into the game after each step
         """
+        grid = self.get_grid()
+        add_entity = grid.add_entity
+        create_entity = self._create_entity
+
         # Generate amount
-        entity_count = random.randint(0, self.get_grid().get_size() - 3)
+        entity_count = random.randint(0, grid.get_size() - 3)
         entities = random.choices(ENTITY_TYPES, k=entity_count)
 
-        # Blocker in a 1 in 4 chance
-        blocker = random.randint(1, 4) % 4 == 0
-
-        bomb = False
-        if not blocker:
-            bomb = random.randint(1, 4) % 4 == 0
-
-        total_count = entity_count
-        if blocker:
-            total_count += 1
+        # Blocker in a 1 in 4 chance, otherwise bomb in a 1 in 4 chance
+        extras = random.getrandbits(4)
+        if not extras & 0b11:
             entities.append(BLOCKER)
-
-        if bomb:
-            total_count += 1
+        elif not extras >> 2:
             entities.append(BOMB)
 
-        entity_index = random.sample(range(self.get_grid().get_size()),
-                                     total_count)
+        positions = random.sample(self._SPAWN_POSITIONS, len(entities))
 
         # Add entities into grid
-        for pos, entity in zip(entity_index, entities):
-            position = Position(pos, self.get_grid().get_size() - 1)
-            new_entity = self._create_entity(entity)
-            self.get_grid().add_entity(position, new_entity)
+        for position, entity in zip(positions, entities):
+            add_entity(position, create_entity(entity))
+
+
+# Entity type -> image, filled in by _get_image
+_IMAGE_CACHE = {}
+
+
+def _get_image(entity_type: str) -> tk.PhotoImage:
+    """(tk.PhotoImage) Return the cached image for the entity type, loading it
+    on first use.
+
+    Parameters:
+        entity_type (str): the display character of the entity
+    """
+    image = _IMAGE_CACHE.get(entity_type)
+    if image is None:
+        image = tk.PhotoImage(file=f'images/{IMAGES[entity_type]}')
+        _IMAGE_CACHE[entity_type] = image
+    return image
+
+
+def preload_images() -> None:
+    """Loads every entity image into the cache up front, so drawing never has
+    to read from disk. A Tk root must already exist."""
+    for entity_type in IMAGES:
+        _get_image(entity_type)
 
 
 class ImagesGameField(GameField):
@@ -1030,28 +1236,37 @@ class ImagesGameField(GameField):
         """
         super().__init__(
             master, size=size, width=width, height=height, **kwargs)
-        self._img = []
-        self._pos = []
+        # position -> pixel centre
+        self._centres = {}
 
-    def draw_grid(self, entities: Dict[Position, Entity]) -> None:
-        """Draws the entities in the game grid at their given position using an
-        image identifying the entity
+    def _draw_cell(
+            self, position: Position, entity_type: str
+    ) -> Tuple[int, ...]:
+        """Draws the image of the entity type centred in the cell
 
         Parameters:
-            entities (dict): A dict of current entities, including the player
+            position (Position): the position of the cell
+            entity_type (str): the display character of the entity
+
+        Returns:
+            (tuple): the id of the image drawn
         """
-        self._img = []
-        self._pos = []
+        centre = self._centres.get(position)
+        if centre is None:
+            centre = self.get_position_center(position)
+            self._centres[position] = centre
+        return (self.create_image(
+            centre, image=_get_image(entity_type), anchor=tk.CENTER
+        ),)
 
-        for pos, entity in entities.items():
-            entity_type = entity.display()
-            self._img.append(
-                tk.PhotoImage(file=f'images/{IMAGES[entity_type]}')
-            )
-            self._pos.append(self.get_position_center(pos))
+    def _recolour_cell(self, ids: Tuple[int, ...], entity_type: str) -> None:
+        """Changes the image drawn by _draw_cell to another entity type
 
-        for i, img in enumerate(self._img):
-            self.create_image(self._pos[i], image=img, anchor=tk.CENTER)
+        Parameters:
+            ids (tuple): the ids returned by _draw_cell
+            entity_type (str): the display character of the new entity
+        """
+        self.itemconfig(ids[0], image=_get_image(entity_type))
 
 
 class StatusBar(tk.Frame):
@@ -1068,6 +1283,8 @@ class StatusBar(tk.Frame):
         self._total_shots_num = None
         self._time_num = None
         self._btn = None
+        # label -> text still to be shown
+        self._pending = {}
 
     def draw_grid(self) -> None:
         """Draws the Total Shots, Timer"""
@@ -1111,7 +1328,7 @@ class StatusBar(tk.Frame):
         Parameters:
             shots (int): the latest total shots
         """
-        self._total_shots_num.config(text=str(shots))
+        self._set_text(self._total_shots_num, str(shots))
 
     def update_time(self, time: int) -> None:
         """Updates the time that has passed
@@ -1119,7 +1336,25 @@ class StatusBar(tk.Frame):
         Parameters:
             time (int): the time that has passed
         """
-        self._time_num.config(text=f'{time // 60}m {time % 60}s')
+        self._set_text(self._time_num, f'{time // 60}m {time % 60}s')
+
+    def _set_text(self, label: tk.Label, text: str) -> None:
+        """Queues new text for a label. All queued text is applied in one go
+        when Tk is next idle, so the frame is laid out once per batch.
+
+        Parameters:
+            label (tk.Label): the label to update
+            text (str): the new text of the label
+        """
+        if not self._pending:
+            self.after_idle(self._flush)
+        self._pending[label] = text
+
+    def _flush(self) -> None:
+        """Applies the queued label text"""
+        for label, text in self._pending.items():
+            label.config(text=text)
+        self._pending.clear()
 
 
 def start_game(root, TASK=3):
@@ -1137,6 +1372,7 @@ def start_game(root, TASK=3):
 def main():
     root = tk.Tk()
     root.title(TITLE)
+    preload_images()
     app = start_game(root)
     root.mainloop()
 